@@ -0,0 +1,28 @@
+# cython: language_level=3
+"""
+Optional Cython fast path for the CURIE namespace scan in
+generate_shacl_ontology.py.
+
+Build in place (requires cython):
+    cythonize -i curie_kernel.pyx
+
+The generator script try-imports this module and falls back to the
+pure-Python scan when it is not importable, so building it is never
+required.
+"""
+
+cpdef compact(str v, list ns_list, list pfx_list):
+    """
+    Return 'pfx:local' for the first namespace in ns_list that v starts
+    with, or None when nothing matches (or the local name is empty, in
+    which case the caller's <...> fallback applies).
+    """
+    cdef Py_ssize_t i, n = len(ns_list)
+    cdef str ns
+    for i in range(n):
+        ns = <str> ns_list[i]
+        if v.startswith(ns):
+            if len(v) == len(ns):
+                return None
+            return (<str> pfx_list[i]) + ":" + v[len(ns):]
+    return None
@@ -27,11 +27,28 @@ USAGE (from within application-profile/):
       --base-prefix agimage \
       [--add-codelists]    # optional: build SKOS from allowedValues
       [--emit-external-class-blocks]   # optional: emit owl:Class for dcat/sosa
+
+Optional dependency: `pip install python-calamine` switches the Excel
+parse to pandas' much faster calamine engine (pandas >= 2.2).
 """
 
 import argparse
-import math
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+
+import openpyxl
 import pandas as pd
+from pandas.io.parsers import TextParser
+
+# Optional compiled fast path for the CURIE namespace scan; build with
+# `cythonize -i curie_kernel.pyx`. The pure-Python scan is used otherwise.
+try:
+    from curie_kernel import compact as _curie_kernel_compact
+except ImportError:
+    _curie_kernel_compact = None
 
 # -------------------------------
 # CLI
@@ -51,14 +68,20 @@ def parse_args():
 # -------------------------------
 # Helpers
 # -------------------------------
-def is_nan(v):
-    return v is None or (isinstance(v, float) and math.isnan(v))
+# Turtle string escapes, applied in one C-level translate pass. Besides the
+# quote, escape backslashes and control chars that would break the literal.
+_TTL_ESCAPE = str.maketrans({
+    "\\": "\\\\",
+    '"':  '\\"',
+    "\n": "\\n",
+    "\r": "\\r",
+    "\t": "\\t",
+})
 
 def safe_literal(s):
     if s is None:
         return ""
-    s = str(s)
-    return s.replace('"', '\\"')
+    return str(s).translate(_TTL_ESCAPE)
 
 def build_prefix_map(base_ns: str, base_prefix: str):
     return {
@@ -78,43 +101,107 @@ def build_prefix_map(base_ns: str, base_prefix: str):
         # DO NOT include 'newont' on purpose, we normalize it away.
     }
 
-def ttl_prefix_header(pmap: dict, base_ns: str) -> str:
+def ttl_prefix_lines(pmap: dict) -> str:
     lines = []
     for pfx, ns in pmap.items():
         end = "" if ns.endswith(("#", "/")) else "/"
         lines.append(f"@prefix {pfx}: <{ns}{end}> .")
-    lines.append(f"\n<{base_ns}> a owl:Ontology .\n")
-    return "\n".join(lines) + "\n"
-
-def compact_curie(value: str, prefix_map: dict) -> str:
-    """ Compact absolute URIs to CURIEs. Keep CURIEs; fallback to <...>. """
-    if value is None:
-        return None
-    v = str(value).strip()
-    if not v:
-        return v
-    if ":" in v and not v.startswith(("http://", "https://")):
-        # already a CURIE with a known prefix?
-        pfx = v.split(":", 1)[0]
-        if pfx in prefix_map:
+    return "\n".join(lines)
+
+def ttl_prefix_header(pmap: dict, base_ns: str) -> str:
+    return ttl_prefix_lines(pmap) + f"\n\n<{base_ns}> a owl:Ontology .\n\n"
+
+def _compile_pmap(pmap: dict):
+    """ Normalize each namespace once and sort longest-first so the first
+    match wins even when one namespace is a prefix of another. """
+    return sorted(
+        ((ns if ns.endswith(("#", "/")) else ns + "/", pfx) for pfx, ns in pmap.items()),
+        key=lambda t: -len(t[0]),
+    )
+
+def _build_authority_index(compiled: list):
+    """ Index namespaces by their scheme-stripped form so a URI can be
+    resolved with a couple of dict probes (one per distinct key length,
+    longest first) instead of a linear startswith scan. """
+    index = {}
+    lengths = set()
+    for ns_eff, pfx in compiled:
+        if ns_eff.startswith("https://"):
+            key = ns_eff[8:]
+        elif ns_eff.startswith("http://"):
+            key = ns_eff[7:]
+        else:
+            continue
+        index.setdefault(key, (pfx, ns_eff))
+        lengths.add(len(key))
+    return index, sorted(lengths, reverse=True)
+
+def make_compact_curie(compiled: list):
+    """ Build a memoized CURIE compactor over a compiled (ns_eff, pfx) list.
+    Compacts absolute URIs to CURIEs; keeps CURIEs; falls back to <...>. """
+    ns_list = [ns_eff for ns_eff, _ in compiled]
+    pfx_list = [pfx for _, pfx in compiled]
+    auth_index, auth_lengths = _build_authority_index(compiled)
+    kernel = _curie_kernel_compact
+
+    @lru_cache(maxsize=4096)
+    def compact_curie(value):
+        if value is None:
+            return None
+        v = str(value).strip()
+        if not v:
+            return v
+        if ":" in v and not v.startswith(("http://", "https://")):
+            # already a CURIE (known or unknown prefix) -> keep as-is
             return v
-        # unknown prefix -> map to base (handled later)
-        return v
 
-    if v.startswith("<") and v.endswith(">"):
-        v = v[1:-1].strip()
+        if v.startswith("<") and v.endswith(">"):
+            v = v[1:-1].strip()
+
+        # Fast path: probe the authority index with scheme-stripped
+        # prefixes of v (one dict lookup per distinct namespace length).
+        # A miss falls through to the scan, which stays the ground truth.
+        if v.startswith("https://"):
+            rest = v[8:]
+        elif v.startswith("http://"):
+            rest = v[7:]
+        else:
+            rest = None
+        if rest is not None:
+            for length in auth_lengths:
+                hit = auth_index.get(rest[:length])
+                if hit is not None and v.startswith(hit[1]):
+                    local = v[len(hit[1]):]
+                    if not local:
+                        return f"<{v}>"
+                    return f"{hit[0]}:{local}"
+
+        if kernel is not None:
+            # Compiled scan; None means no usable match (fall through to
+            # the <...> / passthrough handling below).
+            res = kernel(v, ns_list, pfx_list)
+            if res is not None:
+                return res
+        else:
+            for ns_eff, pfx in compiled:
+                if v.startswith(ns_eff):
+                    local = v[len(ns_eff):]
+                    if not local:
+                        return f"<{v}>"
+                    return f"{pfx}:{local}"
+
+        if v.startswith(("http://", "https://")):
+            return f"<{v}>"
+        return v
 
-    for pfx, ns in prefix_map.items():
-        ns_eff = ns if ns.endswith(("#", "/")) else ns + "/"
-        if v.startswith(ns_eff):
-            local = v[len(ns_eff):]
-            if not local:
-                return f"<{v}>"
-            return f"{pfx}:{local}"
+    return compact_curie
 
-    if v.startswith(("http://", "https://")):
-        return f"<{v}>"
-    return v
+# Interned property-type tokens: _compile_rows interns each row's type, so
+# in-process == comparisons against these hit the identity fast path.
+# (Records may also cross a process boundary, where interning is lost, so
+# the generators still compare with == rather than 'is'.)
+_OBJECT = sys.intern("object")
+_DATATYPE = sys.intern("datatype")
 
 # Excel → authoritative class mapping
 CLASS_MAP = {
@@ -138,295 +225,457 @@ LOCAL_CLASS_NORMALIZATION = {
 def normalize_local_class(local: str) -> str:
     if not local:
         return local
-    if local in LOCAL_CLASS_NORMALIZATION:
-        return LOCAL_CLASS_NORMALIZATION[local]
+    mapped = LOCAL_CLASS_NORMALIZATION.get(local)
+    if mapped is not None:
+        return mapped
     # If it looks lowercase but not in map, capitalize first letter
     return local[:1].upper() + local[1:] if local[:1].islower() else local
 
-def normalize_class_like(s: str, base_prefix: str, pmap: dict) -> str:
+def make_normalize_class_like(base_prefix: str, known_prefixes: frozenset, compact_curie):
     """
-    Normalize class-like strings from Excel:
+    Build a memoized normalizer for class-like strings from Excel:
       - 'newont:plot'  -> base_prefix:Plot
       - 'plot'         -> base_prefix:Plot
       - 'Plot'         -> base_prefix:Plot
       - 'Sensor'       -> sosa:Sensor (mapped)
       - absolute URIs  -> compact to CURIE
       - existing CURIE with unknown prefix -> remap to base
+    Each distinct entity name is only evaluated once per run.
     """
-    if not s:
-        return None
-    s = str(s).strip()
-
-    # explicit external mapping
-    if s in CLASS_MAP:
-        return CLASS_MAP[s]
-
-    # CURIE?
-    if ":" in s and not s.startswith(("http://", "https://")):
-        pfx, local = s.split(":", 1)
-        local = normalize_local_class(local)
-        if pfx in ("newont", base_prefix):
+    @lru_cache(maxsize=4096)
+    def normalize_class_like(s):
+        if not s:
+            return None
+        s = str(s).strip()
+
+        # explicit external mapping (single hash probe)
+        mapped = CLASS_MAP.get(s)
+        if mapped is not None:
+            return mapped
+
+        # CURIE?
+        if ":" in s and not s.startswith(("http://", "https://")):
+            pfx, local = s.split(":", 1)
+            local = normalize_local_class(local)
+            if pfx in ("newont", base_prefix):
+                return f"{base_prefix}:{local}"
+            if pfx in known_prefixes:
+                return f"{pfx}:{local}"
+            # unknown prefix -> remap to base
             return f"{base_prefix}:{local}"
-        if pfx in pmap:
-            return f"{pfx}:{local}"
-        # unknown prefix -> remap to base
+
+        # Absolute URI
+        if s.startswith(("http://", "https://")):
+            return compact_curie(s)
+
+        # Bare local class name
+        local = normalize_local_class(s)
+        mapped = CLASS_MAP.get(local)
+        if mapped is not None:
+            return mapped
         return f"{base_prefix}:{local}"
 
-    # Absolute URI
-    if s.startswith(("http://", "https://")):
-        return compact_curie(s, pmap)
-
-    # Bare local class name
-    local = normalize_local_class(s)
-    if local in CLASS_MAP:
-        return CLASS_MAP[local]
-    return f"{base_prefix}:{local}"
-
-def normalize_uri(value: str) -> str:
-    """ Fix 'agri-images' -> 'agri-image' typos inside URIs. """
-    if value is None:
-        return value
-    v = str(value)
-    return v.replace("w3id.org/agri-images", "w3id.org/agri-image")
-
-def parse_allowed_values(s):
-    """Parse allowedValues from "['a','b']" or simple CSV "a,b,c" to list."""
-    if not isinstance(s, str):
-        return []
-    txt = s.strip()
-    if not txt:
-        return []
-    # Normalize common patterns
-    txt = txt.replace("[", "").replace("]", "").replace("'", "")
-    parts = [p.strip() for p in txt.split(",") if p.strip()]
-    return parts
+    return normalize_class_like
+
+def _normalize_local_series(local: pd.Series) -> pd.Series:
+    """ Vectorized normalize_local_class over a string Series. """
+    cap = local.str[:1].str.upper() + local.str[1:]
+    cap = cap.where(local.str[:1].str.islower().fillna(False), local)
+    return local.map(LOCAL_CLASS_NORMALIZATION).fillna(cap)
+
+def _compact_curie_series(s: pd.Series, compiled: list) -> pd.Series:
+    """ Vectorized compact_curie over a string Series (same semantics). """
+    v = s.str.strip()
+    # The scalar path returns CURIE-looking values (contain ':' but are not
+    # absolute URIs, including bracketed '<http...>') verbatim before its
+    # angle-bracket strip; keep those untouched here as well.
+    curie_like = (v.str.contains(":", regex=False)
+                  & ~v.str.startswith(("http://", "https://"))).fillna(False)
+    ang = (~curie_like & v.str.startswith("<") & v.str.endswith(">")).fillna(False)
+    v = v.mask(ang, v.str[1:-1].str.strip())
+    out = v.copy()
+    pending = ~curie_like & v.str.startswith(("http://", "https://")).fillna(False)
+    for ns_eff, pfx in compiled:
+        hit = pending & v.str.startswith(ns_eff).fillna(False)
+        if hit.any():
+            local = v[hit].str[len(ns_eff):]
+            out[hit] = (pfx + ":" + local).mask(local.eq(""), "<" + v[hit] + ">")
+            pending &= ~hit
+    return out.mask(pending, "<" + v + ">")
+
+def _normalize_class_like_series(s: pd.Series, base_prefix: str, compiled: list,
+                                 known_prefixes: frozenset) -> pd.Series:
+    """ Vectorized normalize_class_like over a string Series (same semantics). """
+    s = s.str.strip()
+    out = s.map(CLASS_MAP)
+    # Whitespace-only cells stay NaN (the scalar path returns None for
+    # them), so the caller's write-back keeps the original value and the
+    # row compiler drops it instead of emitting a bare 'base_prefix:'.
+    pending = out.isna() & s.notna() & s.ne("").fillna(False)
+
+    is_http = s.str.startswith(("http://", "https://")).fillna(False)
+    is_curie = pending & ~is_http & s.str.contains(":", regex=False).fillna(False)
+    if is_curie.any():
+        parts = s[is_curie].str.split(":", n=1)
+        pfx = parts.str[0]
+        local = _normalize_local_series(parts.str[1])
+        pfx = pfx.where(pfx.isin(known_prefixes) & ~pfx.isin(["newont", base_prefix]), base_prefix)
+        out[is_curie] = pfx + ":" + local
+        pending &= ~is_curie
+
+    http_rows = pending & is_http
+    if http_rows.any():
+        out[http_rows] = _compact_curie_series(s[http_rows], compiled)
+        pending &= ~http_rows
+
+    if pending.any():
+        local = _normalize_local_series(s[pending])
+        out[pending] = local.map(CLASS_MAP).fillna(base_prefix + ":" + local)
+    return out
+
+# Bracket/quote noise stripped from allowedValues cells ("['a','b']" or CSV).
+_ALLOWED_CLEAN_RE = re.compile(r"[\[\]']")
+
+def _openpyxl_cell_value(cell):
+    """ Mirror pandas' openpyxl cell converter: None -> "", errors -> NaN,
+    booleans stay bool, and whole floats collapse to int. """
+    v = cell.value
+    if v is None:
+        return ""
+    t = cell.data_type
+    if t == "e":
+        return float("nan")
+    if t == "b":
+        return bool(v)
+    if t == "n":
+        i = int(v)
+        return i if i == v else float(v)
+    return v
 
 # -------------------------------
 # EXCEL NORMALISATION
 # -------------------------------
-def load_and_normalize_excel(path: str, base_prefix: str, base_ns: str, pmap: dict) -> pd.DataFrame:
-    df = pd.read_excel(path, engine="openpyxl")
+def load_and_normalize_excel(path: str, base_prefix: str,
+                             compiled: list, known_prefixes: frozenset) -> pd.DataFrame:
+    # Prefer pandas' Rust-backed calamine engine when python-calamine is
+    # installed (pandas >= 2.2): several times faster than openpyxl with
+    # lower memory. Otherwise stream cells via openpyxl's read-only mode,
+    # which avoids building the full in-memory cell graph. We only ever
+    # read values, so both paths are always safe.
+    try:
+        import python_calamine  # noqa: F401
+        df = pd.read_excel(path, engine="calamine")
+    except ImportError:
+        wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        # Sheet 0, same as pandas' default in the calamine branch (wb.active
+        # could differ on a workbook saved with another tab selected).
+        ws = wb.worksheets[0]
+        # Convert cells the way pandas' openpyxl reader does and run the
+        # rows through TextParser, as pd.read_excel itself would: the frame
+        # is then identical no matter which engine handled the workbook.
+        data = [[_openpyxl_cell_value(c) for c in row] for row in ws.iter_rows()]
+        wb.close()
+        df = TextParser(data, header=0).read()
+
+    # Bulk string replace: 'agri-images' -> 'agri-image' in all string cells.
+    # Vectorized per-column instead of applymap: one C-level pass per object
+    # column rather than a Python lambda per cell. Non-string cells (the .str
+    # accessor yields NaN for them) keep their original values via fillna.
+    # Skip object columns holding no strings at all (e.g. all-boolean with a
+    # blank cell): .str refuses those outright, where applymap did not care.
+    for col in df.select_dtypes(include="object").columns:
+        if pd.api.types.infer_dtype(df[col], skipna=True) not in (
+                "string", "mixed", "mixed-integer", "empty"):
+            continue
+        fixed = df[col].str.replace("w3id.org/agri-images", "w3id.org/agri-image", regex=False)
+        df[col] = fixed.fillna(df[col])
 
-    # Bulk string replace: 'agri-images' -> 'agri-image' in all string cells
-    df = df.applymap(lambda v: normalize_uri(v) if isinstance(v, str) else v)
+    # Normalize 'datatype' column (class-like for object properties, datatypes for datatype props).
+    # Split by the 'type' mask and run each branch through the vectorized
+    # helpers instead of a row-wise apply.
+    # Normalize 'type' once: downstream row loops compare the raw value.
+    if "type" in df.columns:
+        df["type"] = df["type"].astype("string").str.strip().str.lower()
 
-    # Normalize 'datatype' column (class-like for object properties, datatypes for datatype props)
     if "datatype" in df.columns:
-        def _norm_dtype(row):
-            dtype = row.get("datatype")
-            ptype = str(row.get("type")).strip().lower() if not is_nan(row.get("type")) else ""
-            if is_nan(dtype):
-                return dtype
-            val = str(dtype).strip()
-
-            # For object properties, datatype stands for target CLASS
-            if ptype == "object":
-                return normalize_class_like(val, base_prefix, pmap)
-
-            # For datatype properties, keep xsd/rdf/rdfs* compact; otherwise compact or leave
-            if val.startswith(("xsd:", "rdf:", "rdfs:")):
-                return val
-            return compact_curie(val, pmap)
-
-        df["datatype"] = df.apply(_norm_dtype, axis=1)
+        dtype = df["datatype"].astype("string").str.strip()
+        if "type" in df.columns:
+            ptype = df["type"]
+        else:
+            ptype = pd.Series(pd.NA, index=df.index, dtype="string")
+        is_obj = ptype.eq("object").fillna(False)
+
+        out = dtype.copy()
+        # For object properties, datatype stands for target CLASS
+        obj_rows = is_obj & dtype.notna()
+        if obj_rows.any():
+            out[obj_rows] = _normalize_class_like_series(dtype[obj_rows], base_prefix,
+                                                         compiled, known_prefixes)
+        # For datatype properties, keep xsd/rdf/rdfs* compact; otherwise compact or leave
+        keep = dtype.str.startswith(("xsd:", "rdf:", "rdfs:")).fillna(False)
+        dt_rows = ~is_obj & dtype.notna() & ~keep
+        if dt_rows.any():
+            out[dt_rows] = _compact_curie_series(dtype[dt_rows], compiled)
+        df["datatype"] = out.astype(object).where(out.notna(), df["datatype"])
 
     # Normalize 'entity' names only for usage as domain classes later (domain will use mapping)
     if "entity" in df.columns:
-        df["entity"] = df["entity"].apply(lambda e: normalize_local_class(str(e).strip()) if not is_nan(e) else e)
+        ent = df["entity"].astype("string").str.strip()
+        norm = _normalize_local_series(ent)
+        df["entity"] = norm.astype(object).where(norm.notna(), df["entity"])
 
-    # Normalize 'uri' (paths): fix typos + compact later during generation
-    if "uri" in df.columns:
-        df["uri"] = df["uri"].apply(lambda u: normalize_uri(u) if not is_nan(u) else u)
+    # 'uri' and 'allowedValues' are already covered by the vectorized
+    # replace above; no second per-cell pass needed.
 
-    # Clean allowedValues formatting
+    # Parse allowedValues once for both generators: strip bracket/quote
+    # noise in a single C-level regex pass, then split into lists.
     if "allowedValues" in df.columns:
-        df["allowedValues"] = df["allowedValues"].apply(lambda s: normalize_uri(s) if isinstance(s, str) else s)
+        parts = df["allowedValues"].astype("string").str.replace(_ALLOWED_CLEAN_RE, "", regex=True).str.split(",")
+        df["_allowed_parsed"] = parts.apply(
+            lambda xs: [x.strip() for x in xs if x.strip()] if isinstance(xs, list) else [])
+    else:
+        df["_allowed_parsed"] = [[] for _ in range(len(df))]
 
     return df
 
-# -------------------------------
-# ONTOLOGY GENERATOR
-# -------------------------------
-def build_ontology(df: pd.DataFrame, onto_path: str, base_prefix: str, base_ns: str,
-                   pmap: dict, add_codelists: bool, emit_external_class_blocks: bool):
-    ttl = []
-    ttl.append(ttl_prefix_header(pmap, base_ns))
-
-    emitted_classes = set()
-    entities = [str(e).strip() for e in df["entity"].dropna().unique()]
-
-    # Emit classes ONLY for non-mapped entities (avoid duplicating dcat/sosa)
-    for entity in entities:
-        class_curie = normalize_class_like(entity, base_prefix, pmap)
-        if entity in CLASS_MAP and not emit_external_class_blocks:
-            continue
-        if class_curie in emitted_classes:
-            continue
-        # Use only rdfs:label; avoid injecting property descriptions into class comments
-        ttl.append(f"{class_curie} a owl:Class ;")
-        ttl.append(f'    rdfs:label "{safe_literal(entity)}" ;')
-        ttl.append("    .\n")
-        emitted_classes.add(class_curie)
-
-    # Properties
-    for _, row in df.iterrows():
-        entity = str(row.get("entity")).strip() if not is_nan(row.get("entity")) else ""
+# Characters not allowed in SKOS concept local names, replaced in one pass.
+_SKOS_LOCAL_SANITIZE = str.maketrans({" ": "_", "/": "_", ":": "_", ",": "_"})
+
+# Columns consumed by the generator row loops, in itertuples order.
+_ROW_COLS = ["entity", "uri", "property", "description", "example", "type",
+             "datatype", "cardinalityMin", "cardinalityMax", "_allowed_parsed"]
+
+@dataclass(slots=True)
+class RowRec:
+    """ One normalized profile row, shared by both generators. """
+    entity: str
+    domain: str
+    path: str          # property CURIE, or None when the row has no uri
+    ptype: str
+    range_term: str    # resolved range/target CURIE or datatype, or None
+    label: str
+    comment: str
+    example: object
+    minc: int       # resolved sh:minCount, or None
+    maxc: int       # resolved sh:maxCount, or None ('*' means unbounded)
+    allowed: list
+
+def _compile_rows(df: pd.DataFrame, normalize_cls, compact) -> list:
+    """ Normalize each row once; build_ontology and build_shacl both
+    consume the resulting records instead of redoing the work. """
+    records = []
+    sub = df.reindex(columns=_ROW_COLS)
+    # Structure-of-arrays view: one to_numpy per column up front, then the
+    # loop does plain integer indexing instead of materializing row tuples.
+    cols = {c: sub[c].to_numpy() for c in _ROW_COLS}
+    # One C-level isna pass per column; the row loop then tests a plain
+    # boolean ndarray entry instead of calling is_nan per cell.
+    na = {c: sub[c].isna().to_numpy() for c in _ROW_COLS[:-1]}
+    na_entity, na_uri, na_label, na_comment, na_example = (
+        na["entity"], na["uri"], na["property"], na["description"], na["example"])
+    na_type, na_dtype, na_minc, na_maxc = (
+        na["type"], na["datatype"], na["cardinalityMin"], na["cardinalityMax"])
+    col_entity, col_uri, col_label, col_comment, col_example = (
+        cols["entity"], cols["uri"], cols["property"], cols["description"], cols["example"])
+    col_type, col_dtype, col_minc, col_maxc, col_allowed = (
+        cols["type"], cols["datatype"], cols["cardinalityMin"], cols["cardinalityMax"],
+        cols["_allowed_parsed"])
+
+    for i in range(len(sub)):
+        entity = str(col_entity[i]).strip() if not na_entity[i] else ""
         if not entity:
             continue
 
-        # Domain class (mapped)
-        domain_curie = normalize_class_like(entity, base_prefix, pmap)
-
-        # Property path
-        raw_prop_uri = row.get("uri")
-        if is_nan(raw_prop_uri) or not str(raw_prop_uri).strip():
-            continue
-        prop_curie = compact_curie(str(raw_prop_uri).strip(), pmap)
-
-        label = None if is_nan(row.get("property")) else str(row.get("property")).strip()
-        comment = None if is_nan(row.get("description")) else str(row.get("description")).strip()
-        example = None if is_nan(row.get("example")) else row.get("example")
-
-        ptype = str(row.get("type")).strip().lower() if not is_nan(row.get("type")) else ""
-        dtype_raw = None if is_nan(row.get("datatype")) else str(row.get("datatype")).strip()
-
-        if ptype == "object":
-            range_curie = normalize_class_like(dtype_raw, base_prefix, pmap) if dtype_raw else None
-            ttl.append(f"{prop_curie} a owl:ObjectProperty ;")
-            ttl.append(f"    rdfs:domain {domain_curie} ;")
-            if range_curie:
-                ttl.append(f"    rdfs:range {range_curie} ;")
-            if label:
-                ttl.append(f'    rdfs:label "{safe_literal(label)}" ;')
-            if comment:
-                ttl.append(f'    rdfs:comment "{safe_literal(comment)}" ;')
-            if example not in (None, ""):
-                ttl.append(f'    rdfs:comment "Example: {safe_literal(example)}" ;')
-            ttl.append("    .\n")
-
-        elif ptype == "datatype":
-            # Range is a datatype (xsd:* etc.) or URI
+        domain = normalize_cls(entity)
+        path = None
+        if not na_uri[i] and str(col_uri[i]).strip():
+            path = compact(str(col_uri[i]).strip())
+
+        label = None if na_label[i] else str(col_label[i]).strip()
+        comment = None if na_comment[i] else str(col_comment[i]).strip()
+        example = None if na_example[i] else col_example[i]
+
+        # 'type' is already stripped/lowercased by the loader; intern it so
+        # the generator comparisons hit the pointer-equality fast path.
+        ptype = sys.intern(str(col_type[i])) if not na_type[i] else ""
+        dtype_raw = None if na_dtype[i] else str(col_dtype[i]).strip()
+
+        if ptype is _OBJECT:
+            range_term = normalize_cls(dtype_raw) if dtype_raw else None
+        elif ptype is _DATATYPE and dtype_raw:
+            if dtype_raw.startswith(("xsd:", "rdf:", "rdfs:")):
+                range_term = dtype_raw
+            else:
+                range_term = compact(dtype_raw)
+        else:
             range_term = None
-            if dtype_raw:
-                if dtype_raw.startswith(("xsd:", "rdf:", "rdfs:")):
-                    range_term = dtype_raw
-                else:
-                    range_term = compact_curie(dtype_raw, pmap)
-
-            ttl.append(f"{prop_curie} a owl:DatatypeProperty ;")
-            ttl.append(f"    rdfs:domain {domain_curie} ;")
-            if range_term:
-                ttl.append(f"    rdfs:range {range_term} ;")
-            if label:
-                ttl.append(f'    rdfs:label "{safe_literal(label)}" ;')
-            if comment:
-                ttl.append(f'    rdfs:comment "{safe_literal(comment)}" ;')
-            if example not in (None, ""):
-                ttl.append(f'    rdfs:comment "Example: {safe_literal(example)}" ;')
-            ttl.append("    .\n")
-
-        # Optional: SKOS codelist per property
-        if add_codelists and "allowedValues" in row and not is_nan(row["allowedValues"]) and label:
-            vals = parse_allowed_values(str(row["allowedValues"]))
-            if vals:
-                scheme = f"{base_prefix}:{label}Scheme"
-                ttl.append(f"{scheme} a skos:ConceptScheme ;")
-                ttl.append(f'    skos:prefLabel "{safe_literal(label)} controlled vocabulary" .\n')
-                for v in vals:
-                    local = str(v).strip().replace(" ", "_").replace("/", "_").replace(":", "_").replace(",", "_")
-                    cid = f"{base_prefix}:{label}_{local}"
-                    ttl.append(f"{cid} a skos:Concept ;")
-                    ttl.append(f"    skos:inScheme {scheme} ;")
-                    ttl.append(f'    skos:prefLabel "{safe_literal(v)}" .\n')
-
-    with open(onto_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(ttl))
+
+        minc_val = None
+        try:
+            if not na_minc[i]:
+                minc_val = int(float(col_minc[i]))
+        except Exception:
+            pass
+        maxc_val = None
+        try:
+            if not na_maxc[i] and str(col_maxc[i]).strip() != "*":
+                maxc_val = int(float(col_maxc[i]))
+        except Exception:
+            pass
+
+        records.append(RowRec(entity, domain, path, ptype, range_term,
+                              label, comment, example, minc_val, maxc_val, col_allowed[i]))
+    return records
 
 # -------------------------------
-# SHACL GENERATOR
+# ONTOLOGY GENERATOR
 # -------------------------------
-def build_shacl(df: pd.DataFrame, shacl_path: str, base_prefix: str, base_ns: str, pmap: dict):
-    ttl = []
-    # SHACL prefixes
-    header = []
-    for pfx, ns in {**pmap, **{"sh": "http://www.w3.org/ns/shacl#"}}.items():
-        end = "" if ns.endswith(("#", "/")) else "/"
-        header.append(f"@prefix {pfx}: <{ns}{end}> .")
-    header.append("")
-    ttl.append("\n".join(header))
-
-    # One NodeShape per entity
-    for entity in df["entity"].dropna().unique():
-        en = str(entity).strip()
-        if not en:
-            continue
-        target_class = normalize_class_like(en, base_prefix, pmap)
-        shape_name = f"{base_prefix}:{en}Shape"
-        ttl.append(f"{shape_name} a sh:NodeShape ;")
-        ttl.append(f"    sh:targetClass {target_class} ;\n")
-
-        subset = df[df["entity"] == en]
-        for _, row in subset.iterrows():
-            path_raw = row.get("uri")
-            if is_nan(path_raw) or not str(path_raw).strip():
+def build_ontology(df: pd.DataFrame, records: list, onto_path: str, base_prefix: str,
+                   pmap: dict, header: str,
+                   add_codelists: bool, emit_external_class_blocks: bool):
+    # Rebuild the memoized class normalizer here rather than taking it as
+    # an argument: the lru_cache closures do not pickle, and this builder
+    # may run in a worker process. Only the class blocks need it.
+    normalize_cls = make_normalize_class_like(
+        base_prefix, frozenset(pmap), make_compact_curie(_compile_pmap(pmap)))
+
+    # Stream straight to the file instead of accumulating every line in a
+    # list and joining at the end: no second full-size buffer in memory.
+    with open(onto_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        _out = f.write
+
+        def w(line):
+            _out(line)
+            _out("\n")
+
+        w(header)
+
+        emitted_classes = set()
+        entities = [str(e).strip() for e in df["entity"].dropna().unique()]
+
+        # Emit classes ONLY for non-mapped entities (avoid duplicating dcat/sosa)
+        for entity in entities:
+            class_curie = normalize_cls(entity)
+            if entity in CLASS_MAP and not emit_external_class_blocks:
+                continue
+            if class_curie in emitted_classes:
+                continue
+            # Use only rdfs:label; avoid injecting property descriptions into class comments
+            w(f"{class_curie} a owl:Class ;")
+            w(f'    rdfs:label "{safe_literal(entity)}" ;')
+            w("    .\n")
+            emitted_classes.add(class_curie)
+
+        # Properties: one pass over the precompiled records
+        for r in records:
+            if r.path is None:
                 continue
-            path = compact_curie(str(path_raw).strip(), pmap)
-
-            ptype = str(row.get("type")).strip().lower() if not is_nan(row.get("type")) else ""
-            dtype_raw = None if is_nan(row.get("datatype")) else str(row.get("datatype")).strip()
 
-            ttl.append("    sh:property [")
-            ttl.append(f"        sh:path {path} ;")
+            if r.ptype == _OBJECT:
+                w(f"{r.path} a owl:ObjectProperty ;")
+                w(f"    rdfs:domain {r.domain} ;")
+                if r.range_term:
+                    w(f"    rdfs:range {r.range_term} ;")
+                if r.label:
+                    w(f'    rdfs:label "{safe_literal(r.label)}" ;')
+                if r.comment:
+                    w(f'    rdfs:comment "{safe_literal(r.comment)}" ;')
+                if r.example not in (None, ""):
+                    w(f'    rdfs:comment "Example: {safe_literal(r.example)}" ;')
+                w("    .\n")
+
+            elif r.ptype == _DATATYPE:
+                w(f"{r.path} a owl:DatatypeProperty ;")
+                w(f"    rdfs:domain {r.domain} ;")
+                if r.range_term:
+                    w(f"    rdfs:range {r.range_term} ;")
+                if r.label:
+                    w(f'    rdfs:label "{safe_literal(r.label)}" ;')
+                if r.comment:
+                    w(f'    rdfs:comment "{safe_literal(r.comment)}" ;')
+                if r.example not in (None, ""):
+                    w(f'    rdfs:comment "Example: {safe_literal(r.example)}" ;')
+                w("    .\n")
+
+            # Optional: SKOS codelist per property; the whole concept block
+            # is built with one join instead of line-by-line appends.
+            if add_codelists and r.label:
+                label = r.label
+                vals = r.allowed
+                if vals:
+                    scheme = f"{base_prefix}:{label}Scheme"
+                    w(f"{scheme} a skos:ConceptScheme ;")
+                    w(f'    skos:prefLabel "{safe_literal(label)} controlled vocabulary" .\n')
+                    w("\n".join(
+                        f"{base_prefix}:{label}_{v.translate(_SKOS_LOCAL_SANITIZE)} a skos:Concept ;\n"
+                        f"    skos:inScheme {scheme} ;\n"
+                        f'    skos:prefLabel "{safe_literal(v)}" .\n'
+                        for v in vals))
 
-            if ptype == "datatype":
-                dtype = dtype_raw or ""
-                if dtype.startswith(("xsd:", "rdf:", "rdfs:")):
-                    ttl.append(f"        sh:datatype {dtype} ;")
+# -------------------------------
+# SHACL GENERATOR
+# -------------------------------
+def build_shacl(records: list, shacl_path: str, base_prefix: str, header: str):
+    with open(shacl_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        _out = f.write
+
+        def w(line):
+            _out(line)
+            _out("\n")
+
+        # SHACL prefixes (prebuilt in main, sh: included)
+        w(header)
+
+        # One NodeShape per entity, in first-appearance order.
+        groups = {}
+        for r in records:
+            groups.setdefault(r.entity, []).append(r)
+
+        for en, group in groups.items():
+            target_class = group[0].domain
+            shape_name = f"{base_prefix}:{en}Shape"
+            w(f"{shape_name} a sh:NodeShape ;")
+            w(f"    sh:targetClass {target_class} ;\n")
+
+            for r in group:
+                if r.path is None:
+                    continue
+
+                # Buffer the property block locally so an unknown type can
+                # drop it without touching what is already on disk.
+                block = ["    sh:property ["]
+                block.append(f"        sh:path {r.path} ;")
+
+                if r.ptype == _DATATYPE:
+                    block.append(f"        sh:datatype {r.range_term or ''} ;")
+                elif r.ptype == _OBJECT:
+                    block.append(f"        sh:class {r.range_term} ;")
                 else:
-                    ttl.append(f"        sh:datatype {compact_curie(dtype, pmap)} ;")
-            elif ptype == "object":
-                ttl.append(f"        sh:class {normalize_class_like(dtype_raw, base_prefix, pmap)} ;")
-            else:
-                # unknown, skip block cleanly
-                ttl.pop()  # remove sh:property [
-                ttl.pop()  # remove sh:path ...
-                continue
+                    # unknown, skip block cleanly
+                    continue
+
+                # cardinalities (already resolved to ints in _compile_rows)
+                if r.minc is not None:
+                    block.append(f"        sh:minCount {r.minc} ;")
+                if r.maxc is not None:
+                    block.append(f"        sh:maxCount {r.maxc} ;")
 
-            # cardinalities
-            minc = row.get("cardinalityMin")
-            maxc = row.get("cardinalityMax")
-            try:
-                if not is_nan(minc):
-                    ttl.append(f"        sh:minCount {int(float(minc))} ;")
-            except Exception:
-                pass
-            try:
-                if not is_nan(maxc) and str(maxc).strip() != "*":
-                    ttl.append(f"        sh:maxCount {int(float(maxc))} ;")
-            except Exception:
-                pass
-
-            # description / example
-            desc = None if is_nan(row.get("description")) else str(row.get("description")).strip()
-            ex = None if is_nan(row.get("example")) else str(row.get("example")).strip()
-            if desc:
-                ttl.append(f'        sh:description "{safe_literal(desc)}" ;')
-            if ex:
-                ttl.append(f'        sh:example "{safe_literal(ex)}" ;')
-
-            # allowed values -> sh:in
-            allowed = None if is_nan(row.get("allowedValues")) else str(row.get("allowedValues")).strip()
-            vals = parse_allowed_values(allowed) if allowed else []
-            if vals:
-                inlist = " ".join(f"\"{safe_literal(v)}\"" for v in vals)
-                ttl.append(f"        sh:in ( {inlist} ) ;")
-
-            ttl.append("    ] ;\n")
-
-        ttl.append("    .\n")
-
-    with open(shacl_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(ttl))
+                # description / example
+                ex = None if r.example is None else str(r.example).strip()
+                if r.comment:
+                    block.append(f'        sh:description "{safe_literal(r.comment)}" ;')
+                if ex:
+                    block.append(f'        sh:example "{safe_literal(ex)}" ;')
+
+                # allowed values -> sh:in
+                if r.allowed:
+                    inlist = " ".join(f"\"{safe_literal(v)}\"" for v in r.allowed)
+                    block.append(f"        sh:in ( {inlist} ) ;")
+
+                block.append("    ] ;\n")
+                w("\n".join(block))
+
+            w("    .\n")
 
 # -------------------------------
 # MAIN
@@ -435,17 +684,33 @@ def main():
     args = parse_args()
     base_ns = args.base_ns.rstrip("/") + "/"
     pmap = build_prefix_map(base_ns, args.base_prefix)
+    compiled = _compile_pmap(pmap)
+    known_prefixes = frozenset(pmap)
+    compact = make_compact_curie(compiled)
+    normalize_cls = make_normalize_class_like(args.base_prefix, known_prefixes, compact)
 
-    # 1) Load & normalize Excel in-memory
-    df = load_and_normalize_excel(args.input, args.base_prefix, base_ns, pmap)
-
-    # 2) Generate ontology (prefix-compacted, mapped classes, no duplicates)
-    build_ontology(df, args.onto, args.base_prefix, base_ns, pmap,
-                   add_codelists=args.add_codelists,
-                   emit_external_class_blocks=args.emit_external_class_blocks)
+    # Shared prefix headers, built once for both outputs
+    onto_header = ttl_prefix_header(pmap, base_ns)
+    shacl_header = ttl_prefix_lines({**pmap, "sh": "http://www.w3.org/ns/shacl#"}) + "\n"
 
-    # 3) Generate SHACL shapes (prefix-compacted, mapped classes)
-    build_shacl(df, args.shacl, args.base_prefix, base_ns, pmap)
+    # 1) Load & normalize Excel in-memory
+    df = load_and_normalize_excel(args.input, args.base_prefix,
+                                  compiled, known_prefixes)
+
+    # 2) Normalize each row once; both generators consume the records
+    records = _compile_rows(df, normalize_cls, compact)
+
+    # 3+4) Generate ontology and SHACL shapes in parallel: they are
+    # independent and together dominate runtime after the Excel load.
+    with ProcessPoolExecutor(max_workers=2) as ex:
+        onto_fut = ex.submit(build_ontology, df, records, args.onto,
+                             args.base_prefix, pmap, onto_header,
+                             add_codelists=args.add_codelists,
+                             emit_external_class_blocks=args.emit_external_class_blocks)
+        shacl_fut = ex.submit(build_shacl, records, args.shacl,
+                              args.base_prefix, shacl_header)
+        onto_fut.result()
+        shacl_fut.result()
 
     print("[OK] Normalization + Ontology + SHACL generated")
     print(f"[OK] Ontology: {args.onto}")